@@ -5,6 +5,8 @@ This script demonstrates how to use the betainc function and StudentT
 distribution for computing the incomplete beta function and t-distribution CDF.
 """
 
+import time
+
 import torch
 from torch_betainc import betainc, StudentT
 
@@ -41,11 +43,13 @@ def example_betainc_batch():
     b = torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0])
     x = torch.tensor([0.1, 0.3, 0.5, 0.7, 0.9])
     
-    result = betainc(a, b, x)
+    with torch.inference_mode():
+        result = betainc(a, b, x)
     
     print("Batch computation:")
-    for i in range(len(a)):
-        print(f"  betainc(a={a[i].item()}, b={b[i].item()}, x={x[i].item()}) = {result[i].item():.6f}")
+    a_l, b_l, x_l, r_l = a.tolist(), b.tolist(), x.tolist(), result.tolist()
+    for ai, bi, xi, ri in zip(a_l, b_l, x_l, r_l):
+        print(f"  betainc(a={ai}, b={bi}, x={xi}) = {ri:.6f}")
     print()
 
 
@@ -60,12 +64,14 @@ def example_betainc_edge_cases():
     
     # x = 0 should give 0
     x0 = torch.tensor(0.0)
-    result0 = betainc(a, b, x0)
+    with torch.inference_mode():
+        result0 = betainc(a, b, x0)
     print(f"betainc(a={a.item()}, b={b.item()}, x=0.0) = {result0.item():.6f}")
     
     # x = 1 should give 1
     x1 = torch.tensor(1.0)
-    result1 = betainc(a, b, x1)
+    with torch.inference_mode():
+        result1 = betainc(a, b, x1)
     print(f"betainc(a={a.item()}, b={b.item()}, x=1.0) = {result1.item():.6f}")
     print()
 
@@ -102,11 +108,12 @@ def example_studentt_cdf_batch():
     df = torch.tensor(10.0)
     
     dist = StudentT(df=df)
-    result = dist.cdf(x)
+    with torch.inference_mode():
+        result = dist.cdf(x)
     
     print(f"t-distribution CDF with df={df.item()}:")
-    for i in range(len(x)):
-        print(f"  CDF(x={x[i].item():5.1f}) = {result[i].item():.6f}")
+    for xi, ri in zip(x.tolist(), result.tolist()):
+        print(f"  CDF(x={xi:5.1f}) = {ri:.6f}")
     print()
 
 
@@ -122,11 +129,12 @@ def example_studentt_cdf_with_location_scale():
     scale = torch.tensor(2.0)  # Standard deviation
     
     dist = StudentT(df=df, loc=loc, scale=scale)
-    result = dist.cdf(x)
+    with torch.inference_mode():
+        result = dist.cdf(x)
     
     print(f"t-distribution CDF with df={df.item()}, loc={loc.item()}, scale={scale.item()}:")
-    for i in range(len(x)):
-        print(f"  CDF(x={x[i].item():5.1f}) = {result[i].item():.6f}")
+    for xi, ri in zip(x.tolist(), result.tolist()):
+        print(f"  CDF(x={xi:5.1f}) = {ri:.6f}")
     print()
 
 
@@ -143,7 +151,8 @@ def example_broadcasting():
     # Shape (1,)
     x = torch.tensor([0.5])
     
-    result = betainc(a, b, x)
+    with torch.inference_mode():
+        result = betainc(a, b, x)
     
     print(f"Input shapes: a={a.shape}, b={b.shape}, x={x.shape}")
     print(f"Output shape: {result.shape}")
@@ -151,6 +160,93 @@ def example_broadcasting():
     print()
 
 
+def example_numba_scalar_cdf():
+    """Example: Scalar t-distribution CDF inside numba loops (optional)."""
+    print("=" * 60)
+    print("Example 8: Non-Differentiable Scalar CDF with numba (optional)")
+    print("=" * 60)
+    
+    # When only scalar, non-differentiable CDF values are needed inside
+    # your own numba-jitted loop, torch_betainc cannot be called there and
+    # per-call PyTorch dispatch would dominate anyway. SciPy's compiled
+    # betainc can be called directly instead. The timings below compare
+    # this loop with a single batched StudentT.cdf call on the same points.
+    try:
+        import ctypes
+        import numpy as np
+        from numba import njit
+        from numba.extending import get_cython_function_address
+        import scipy.special.cython_special  # noqa: F401
+    except ImportError:
+        print("Skipped: requires numba and scipy")
+        print()
+        return
+    
+    # Depending on the SciPy version, betainc is exported either as a plain
+    # double function or as a fused function. The fused type lists double
+    # before float, so __pyx_fuse_0betainc is the double specialization
+    # (__pyx_fuse_1betainc is the single-precision one).
+    addr = None
+    for name in ("betainc", "__pyx_fuse_0betainc"):
+        try:
+            addr = get_cython_function_address("scipy.special.cython_special", name)
+            break
+        except ValueError:
+            continue
+    if addr is None:
+        print("Skipped: scipy.special.cython_special.betainc not found")
+        print()
+        return
+    
+    functype = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double, ctypes.c_double, ctypes.c_double)
+    c_betainc = functype(addr)
+    
+    @njit
+    def t_cdf_loop(t_values, df):
+        out = np.empty_like(t_values)
+        for i in range(t_values.shape[0]):
+            t = t_values[i]
+            prob = c_betainc(df / 2.0, 0.5, df / (df + t * t))
+            out[i] = 1.0 - 0.5 * prob if t > 0 else 0.5 * prob
+        return out
+    
+    df = 10.0
+    t_values = np.linspace(-4.0, 4.0, 1_000_000)
+    
+    # Compile once before timing
+    t_cdf_loop(t_values[:1], df)
+    
+    start = time.perf_counter()
+    cdf_numba = t_cdf_loop(t_values, df)
+    time_numba = time.perf_counter() - start
+    
+    # The same points through torch_betainc, for comparison
+    dist = StudentT(df=torch.tensor(df, dtype=torch.float64))
+    t_tensor = torch.from_numpy(t_values)
+    with torch.inference_mode():
+        start = time.perf_counter()
+        dist.cdf(t_tensor)
+        time_torch = time.perf_counter() - start
+    
+    # Check a few points against the differentiable implementation
+    check = torch.tensor([-2.0, 0.0, 2.0], dtype=torch.float64)
+    with torch.inference_mode():
+        cdf_torch = dist.cdf(check)
+    cdf_check = t_cdf_loop(check.numpy(), df)
+    
+    print(f"Evaluated {len(cdf_numba):,} CDFs with df={df}:")
+    print(f"  numba loop:           {time_numba * 1000:.2f} ms")
+    print(f"  StudentT.cdf (batch): {time_torch * 1000:.2f} ms")
+    for ti, ni, ri in zip(check.tolist(), cdf_check.tolist(), cdf_torch.tolist()):
+        print(f"  CDF(x={ti:5.1f}): numba={ni:.6f}, torch_betainc={ri:.6f}")
+    
+    agree = np.allclose(cdf_check, cdf_torch.numpy())
+    print(f"Results agree: {agree}")
+    if not agree:
+        print("  (Check that the bound SciPy symbol is the double-precision betainc)")
+    print()
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("torch_betainc: Basic Usage Examples")
@@ -163,6 +259,7 @@ if __name__ == "__main__":
     example_studentt_cdf_batch()
     example_studentt_cdf_with_location_scale()
     example_broadcasting()
+    example_numba_scalar_cdf()
     
     print("=" * 60)
     print("All examples completed successfully!")
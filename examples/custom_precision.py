@@ -51,21 +51,40 @@ print("=" * 60)
 
 # Batch test
 torch.manual_seed(42)
-a_batch = torch.randn(1000).abs() + 2
-b_batch = torch.randn(1000).abs() + 2
+a_batch = torch.empty(1000).uniform_(2, 4)
+b_batch = torch.empty(1000).uniform_(2, 4)
 x_batch = torch.rand(1000)
 
-# Benchmark default settings
-start = time.time()
-for _ in range(100):
-    result = betainc(a_batch, b_batch, x_batch)
-time_default = (time.time() - start) / 100
 
-# Benchmark original settings
-start = time.time()
-for _ in range(100):
+def synchronize():
+    """Wait for pending CUDA work so timings cover the full computation."""
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+
+
+# No gradients are needed for benchmarking, so skip autograd bookkeeping.
+# torch.inference_mode() is the recommended way to run batch inference
+# workloads that never call .backward().
+with torch.inference_mode():
+    # Benchmark default settings
+    # Untimed warmup call so one-time initialization is not measured
+    result = betainc(a_batch, b_batch, x_batch)
+    synchronize()
+    start = time.perf_counter()
+    for _ in range(100):
+        result = betainc(a_batch, b_batch, x_batch)
+    synchronize()
+    time_default = (time.perf_counter() - start) / 100
+
+    # Benchmark original settings
+    # Untimed warmup call so one-time initialization is not measured
     result = betainc(a_batch, b_batch, x_batch, epsilon=1e-12, max_approx=200)
-time_original = (time.time() - start) / 100
+    synchronize()
+    start = time.perf_counter()
+    for _ in range(100):
+        result = betainc(a_batch, b_batch, x_batch, epsilon=1e-12, max_approx=200)
+    synchronize()
+    time_original = (time.perf_counter() - start) / 100
 
 print(f"\nDefault settings (epsilon=1e-14, max_approx=500):")
 print(f"  Time per batch: {time_default*1000:.2f} ms")
@@ -79,9 +98,10 @@ print("\n" + "=" * 60)
 print("Gradient Computation with Custom Settings")
 print("=" * 60)
 
-a = torch.tensor(2.0, requires_grad=True)
-b = torch.tensor(3.0, requires_grad=True)
-x = torch.tensor(0.5, requires_grad=True)
+# Reuse the leaf tensors from above; only their gradients need resetting
+a.grad = None
+b.grad = None
+x.grad = None
 
 # Compute with default settings
 result = betainc(a, b, x)
@@ -118,4 +138,7 @@ print("""
   * Faster computation when extreme precision is not needed
   * Batch processing of many samples
   * Applications away from boundary values (x ≈ 0 or x ≈ 1)
+
+- Wrap batch evaluations that do not need gradients in
+  torch.inference_mode() to skip autograd bookkeeping entirely.
 """)
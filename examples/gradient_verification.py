@@ -8,8 +8,6 @@ Adapted from the original verification code by Arthur Zwaenepoel.
 """
 
 import torch
-import matplotlib.pyplot as plt
-import seaborn as sns
 from torch_betainc import StudentT
 
 
@@ -17,104 +15,82 @@ from torch_betainc import StudentT
 DTYPE = torch.float64
 EPS = 1e-6
 
+# Order of the StudentT CDF arguments
+PARAM_NAMES = ('x', 'df', 'loc', 'scale')
+
 
 def studentt_cdf(x, df, loc, scale):
     """Compute the StudentT CDF through the public torch_betainc API."""
     return StudentT(df=df, loc=loc, scale=scale).cdf(x)
 
 
-def verify_gradients(params, param_key_to_check):
+def analytical_gradients(params):
     """
-    Compute and return both analytical and numerical gradients for a specific parameter.
+    Compute the partial derivatives of the CDF with respect to all parameters.
     
     Args:
-        params (dict): Dictionary of all required parameters (x, df, loc, scale).
-        param_key_to_check (str): The key in the params dict for which to compute the gradient.
+        params (dict): Values for 'x', 'df', 'loc' and 'scale', either all
+            Python floats or all tensors of the same shape.
         
     Returns:
-        A tuple containing (analytical_gradient, numerical_gradient).
+        A dict mapping each parameter name to its element-wise gradient.
     """
-    # --- Analytical Gradient (from custom autograd function) ---
-    
-    # Create tensor copies of all parameters, enabling grad for the target parameter
-    t_params = {k: torch.tensor(v, dtype=DTYPE, requires_grad=(k == param_key_to_check)) 
-                for k, v in params.items()}
-    
-    # Run the forward pass
-    cdf_val = studentt_cdf(**t_params)
-    
-    # Run the backward pass to compute gradients
-    cdf_val.backward()
-    
-    # Extract the computed gradient
-    analytical_grad = t_params[param_key_to_check].grad.item()
-    
-    # --- Numerical Gradient (using the finite difference method) ---
+    # torch.as_tensor lets the helper accept Python floats as well as
+    # tensors; clone() then gives each parameter its own autograd leaf.
+    leaves = {k: torch.as_tensor(v, dtype=DTYPE).clone().requires_grad_(True)
+              for k, v in params.items()}
+    cdf_val = studentt_cdf(**leaves)
     
-    # Create two versions of the parameters, one with a small positive
-    # perturbation (eps) and one with a negative one.
-    params_plus = params.copy()
-    params_plus[param_key_to_check] += EPS
-    t_params_plus = {k: torch.tensor(v, dtype=DTYPE) for k, v in params_plus.items()}
-
-    params_minus = params.copy()
-    params_minus[param_key_to_check] -= EPS
-    t_params_minus = {k: torch.tensor(v, dtype=DTYPE) for k, v in params_minus.items()}
-
-    # Compute the CDF at these two perturbed points
-    cdf_plus = studentt_cdf(**t_params_plus)
-    cdf_minus = studentt_cdf(**t_params_minus)
-    
-    # The centered finite difference formula: (f(x+h) - f(x-h)) / 2h
-    numerical_grad = (cdf_plus - cdf_minus) / (2 * EPS)
-
-    return analytical_grad, numerical_grad.item()
+    # Each output element depends only on its own input elements, so the
+    # gradient of the sum gives the element-wise derivatives. A single
+    # backward pass returns all four partials at once.
+    grads = torch.autograd.grad(cdf_val.sum(), [leaves[k] for k in PARAM_NAMES])
+    return dict(zip(PARAM_NAMES, grads))
 
 
-def plot_gradient_comparison(param_to_vary, fixed_params, param_range):
+def plot_gradient_comparison(row_axes, param_to_vary, params, analytical_grads):
     """
-    Generate and display plots comparing analytical and numerical gradients
-    over a range of values for a single parameter.
+    Plot a comparison of analytical and numerical gradients over a range of
+    values for a single parameter into a row of two existing axes.
+    
+    Args:
+        row_axes: The two matplotlib axes to draw into.
+        param_to_vary (str): The parameter whose values vary along the row.
+        params (dict): 1-D tensors for 'x', 'df', 'loc' and 'scale'; only
+            ``params[param_to_vary]`` varies, the others are constant.
+        analytical_grads (Tensor): The analytical ∂(CDF)/∂(param_to_vary) at
+            each point, as returned by :func:`analytical_gradients`.
     """
     print(f"\n📊 Generating plot for parameter: '{param_to_vary}'...")
     
-    analytical_grads = []
-    numerical_grads = []
+    param_range = params[param_to_vary]
     
-    # Iterate over the specified range, computing both gradients at each point
-    for val in param_range:
-        current_params = fixed_params.copy()
-        current_params[param_to_vary] = val.item()
-        
-        ag, ng = verify_gradients(current_params, param_to_vary)
-        analytical_grads.append(ag)
-        numerical_grads.append(ng)
+    # --- Numerical Gradient (using the finite difference method) ---
+    
+    # The centered finite difference formula: (f(x+h) - f(x-h)) / 2h
+    with torch.no_grad():
+        cdf_plus = studentt_cdf(**{**params, param_to_vary: param_range + EPS})
+        cdf_minus = studentt_cdf(**{**params, param_to_vary: param_range - EPS})
+        numerical_grads = (cdf_plus - cdf_minus) / (2 * EPS)
         
     # --- Plotting ---
-    fig, axes = plt.subplots(1, 2, figsize=(15, 6))
-    title = f"Gradient Verification for '{param_to_vary}' (other parameters fixed)"
-    fig.suptitle(title, fontsize=16)
-
     # Plot 1: Direct comparison of the two gradient calculation methods
-    axes[0].plot(param_range.numpy(), analytical_grads, label='Analytical Gradient (Custom Autograd)', lw=2.5, c='royalblue')
-    axes[0].plot(param_range.numpy(), numerical_grads, label='Numerical Gradient (Finite Diff.)', ls='--', c='darkorange', lw=2)
-    axes[0].set_xlabel(f"Value of '{param_to_vary}'")
-    axes[0].set_ylabel("Gradient Value")
-    axes[0].set_title(f"∂(CDF) / ∂({param_to_vary})")
-    axes[0].legend()
-    axes[0].grid(True, linestyle=':')
+    row_axes[0].plot(param_range.numpy(), analytical_grads.numpy(), label='Analytical Gradient (Custom Autograd)', lw=2.5, c='royalblue')
+    row_axes[0].plot(param_range.numpy(), numerical_grads.numpy(), label='Numerical Gradient (Finite Diff.)', ls='--', c='darkorange', lw=2)
+    row_axes[0].set_xlabel(f"Value of '{param_to_vary}'")
+    row_axes[0].set_ylabel("Gradient Value")
+    row_axes[0].set_title(f"∂(CDF) / ∂({param_to_vary})")
+    row_axes[0].legend()
+    row_axes[0].grid(True, linestyle=':')
     
     # Plot 2: Absolute error between the two methods on a log scale
-    abs_error = torch.tensor([abs(a - n) for a, n in zip(analytical_grads, numerical_grads)])
-    axes[1].plot(param_range.numpy(), abs_error.numpy(), c='crimson', lw=2)
-    axes[1].set_yscale('log')
-    axes[1].set_xlabel(f"Value of '{param_to_vary}'")
-    axes[1].set_ylabel("Absolute Error (log scale)")
-    axes[1].set_title("Error between Analytical and Numerical")
-    axes[1].grid(True, which='both', linestyle=':')
-    
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.show()
+    abs_error = torch.abs(analytical_grads - numerical_grads)
+    row_axes[1].plot(param_range.numpy(), abs_error.numpy(), c='crimson', lw=2)
+    row_axes[1].set_yscale('log')
+    row_axes[1].set_xlabel(f"Value of '{param_to_vary}'")
+    row_axes[1].set_ylabel("Absolute Error (log scale)")
+    row_axes[1].set_title("Error between Analytical and Numerical")
+    row_axes[1].grid(True, which='both', linestyle=':')
     
     # Print summary statistics
     max_error = abs_error.max().item()
@@ -125,6 +101,10 @@ def plot_gradient_comparison(param_to_vary, fixed_params, param_range):
 
 def main():
     """Run gradient verification for all parameters."""
+    # Plotting libraries are only needed here, so keep them out of module import
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
     # Set a professional plotting style
     sns.set_theme(style="whitegrid")
 
@@ -142,23 +122,35 @@ def main():
     print(f"Base parameters (fixed): {base_params}")
     print("=" * 60)
 
-    # --- Generate a plot for each parameter ---
+    # --- Generate one row of plots for each parameter ---
+    fig, axes = plt.subplots(4, 2, figsize=(15, 24))
+    fig.suptitle("Gradient Verification (other parameters fixed)", fontsize=16)
 
-    # 1. Varying 'x' (the point at which the CDF is evaluated)
-    x_range = torch.linspace(-3.0, 4.0, 100, dtype=DTYPE)
-    plot_gradient_comparison('x', base_params, x_range)
-    
-    # 2. Varying 'df' (degrees of freedom)
-    df_range = torch.linspace(2.0, 30.0, 100, dtype=DTYPE)
-    plot_gradient_comparison('df', base_params, df_range)
-    
-    # 3. Varying 'loc' (the location or mean of the distribution)
-    loc_range = torch.linspace(-1.0, 2.0, 100, dtype=DTYPE)
-    plot_gradient_comparison('loc', base_params, loc_range)
-    
-    # 4. Varying 'scale' (the standard deviation of the distribution)
-    scale_range = torch.linspace(0.5, 3.0, 100, dtype=DTYPE)
-    plot_gradient_comparison('scale', base_params, scale_range)
+    # Range of values to sweep for each parameter
+    param_bounds = {
+        'x': (-3.0, 4.0),      # the point at which the CDF is evaluated
+        'df': (2.0, 30.0),     # degrees of freedom
+        'loc': (-1.0, 2.0),    # the location or mean of the distribution
+        'scale': (0.5, 3.0),   # the standard deviation of the distribution
+    }
+    # One row of values per parameter, in PARAM_NAMES order
+    ranges = torch.stack([torch.linspace(*param_bounds[name], 100, dtype=DTYPE)
+                          for name in PARAM_NAMES])
+    
+    # Row i of every parameter tensor holds the base values, except for
+    # PARAM_NAMES[i], which takes its range. One forward and one backward
+    # pass then give the analytical gradients for all 400 points.
+    batch = {name: torch.full_like(ranges, base_params[name]) for name in PARAM_NAMES}
+    for i, name in enumerate(PARAM_NAMES):
+        batch[name][i] = ranges[i]
+    grads = analytical_gradients(batch)
+    
+    for i, name in enumerate(PARAM_NAMES):
+        row_params = {k: v[i] for k, v in batch.items()}
+        plot_gradient_comparison(axes[i], name, row_params, grads[name][i])
+    
+    plt.tight_layout(rect=[0, 0.03, 1, 0.97])
+    plt.show()
     
     print("\n" + "=" * 60)
     print("Gradient verification completed!")
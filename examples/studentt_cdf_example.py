@@ -5,8 +5,9 @@ This example shows how to use the StudentT class from torch_betainc,
 which provides a differentiable CDF method using the incomplete beta function.
 """
 
+import math
+
 import torch
-import matplotlib.pyplot as plt
 from torch_betainc import StudentT
 
 
@@ -21,7 +22,8 @@ def example_basic_usage():
     
     # Compute CDF at various points
     x = torch.tensor([-2.0, -1.0, 0.0, 1.0, 2.0])
-    cdf_values = dist.cdf(x)
+    with torch.inference_mode():
+        cdf_values = dist.cdf(x)
     
     print(f"x values: {x}")
     print(f"CDF values: {cdf_values}")
@@ -42,7 +44,8 @@ def example_with_parameters():
     )
     
     x = torch.tensor([0.0, 2.0, 4.0])
-    cdf_values = dist.cdf(x)
+    with torch.inference_mode():
+        cdf_values = dist.cdf(x)
     
     print(f"Distribution: df=10, loc=2, scale=1.5")
     print(f"x values: {x}")
@@ -83,17 +86,22 @@ def example_batch_computation():
     print("Example 4: Batch Computation")
     print("=" * 60)
     
-    # Create multiple distributions with different degrees of freedom
-    df = torch.tensor([1.0, 2.0, 5.0, 10.0, 30.0])
+    # Create multiple distributions with different degrees of freedom.
+    # df has shape (5, 1) so that it broadcasts against a batch of x values.
+    df = torch.tensor([1.0, 2.0, 5.0, 10.0, 30.0]).view(-1, 1)
     dist = StudentT(df=df)
     
-    # Evaluate CDF at x=1 for all distributions
-    x = torch.tensor(1.0)
-    cdf_values = dist.cdf(x)
-    
-    print("CDF at x=1.0 for different degrees of freedom:")
-    for i, (d, c) in enumerate(zip(df, cdf_values)):
-        print(f"  df={d.item():.1f}: CDF={c.item():.6f}")
+    # Evaluate the CDF at every x for every distribution in one call,
+    # giving a (5, 3) result
+    x = torch.tensor([0.5, 1.0, 1.5])
+    with torch.inference_mode():
+        cdf_values = dist.cdf(x)
+    
+    print("CDF at x=" + ", ".join(f"{xi:.1f}" for xi in x.tolist())
+          + " for different degrees of freedom:")
+    for d, row in zip(df.squeeze(1).tolist(), cdf_values.tolist()):
+        values = ", ".join(f"{c:.6f}" for c in row)
+        print(f"  df={d:4.1f}: CDF=[{values}]")
     print()
 
 
@@ -108,14 +116,16 @@ def example_comparison_with_pytorch():
     df = torch.tensor(5.0)
     x = torch.tensor([0.0, 1.0, 2.0])
     
-    # Our implementation
-    dist_ours = StudentT(df=df)
-    cdf_ours = dist_ours.cdf(x)
-    log_prob_ours = dist_ours.log_prob(x)
-    
-    # PyTorch's implementation
-    dist_pytorch = PyTorchStudentT(df=df)
-    log_prob_pytorch = dist_pytorch.log_prob(x)
+    with torch.inference_mode():
+        # Our implementation. Neither call needs gradients here, so both
+        # run under inference mode.
+        dist_ours = StudentT(df=df)
+        cdf_ours = dist_ours.cdf(x)
+        log_prob_ours = dist_ours.log_prob(x)
+        
+        # PyTorch's implementation
+        dist_pytorch = PyTorchStudentT(df=df)
+        log_prob_pytorch = dist_pytorch.log_prob(x)
     
     print("Our StudentT:")
     print(f"  CDF: {cdf_ours}")
@@ -131,24 +141,32 @@ def example_comparison_with_pytorch():
 
 def example_visualization():
     """Visualize the CDF for different degrees of freedom."""
+    import matplotlib.pyplot as plt
+    
     print("=" * 60)
     print("Example 6: Visualization")
     print("=" * 60)
     
     # Create a range of x values
-    x = torch.linspace(-4, 4, 200)
+    x = torch.linspace(-4, 4, 200, dtype=torch.float64)
+    x_np = x.numpy()
     
     # Different degrees of freedom
     df_values = [1, 2, 5, 10, 30]
     
+    # Evaluate all distributions at once: x of shape (200, 1) broadcasts
+    # against df of shape (5,) to give (200, 5) results
+    dist = StudentT(df=torch.tensor(df_values, dtype=torch.float64))
+    with torch.inference_mode():
+        cdf = dist.cdf(x.unsqueeze(1))
+        pdf = torch.exp(dist.log_prob(x.unsqueeze(1)))
+    
     plt.figure(figsize=(12, 5))
     
     # Plot CDFs
     plt.subplot(1, 2, 1)
-    for df in df_values:
-        dist = StudentT(df=torch.tensor(float(df)))
-        cdf = dist.cdf(x)
-        plt.plot(x.numpy(), cdf.numpy(), label=f'df={df}')
+    for i, df in enumerate(df_values):
+        plt.plot(x_np, cdf[:, i].numpy(), label=f'df={df}')
     
     plt.xlabel('x')
     plt.ylabel('CDF')
@@ -158,10 +176,8 @@ def example_visualization():
     
     # Plot PDFs (using exp(log_prob))
     plt.subplot(1, 2, 2)
-    for df in df_values:
-        dist = StudentT(df=torch.tensor(float(df)))
-        pdf = torch.exp(dist.log_prob(x))
-        plt.plot(x.numpy(), pdf.numpy(), label=f'df={df}')
+    for i, df in enumerate(df_values):
+        plt.plot(x_np, pdf[:, i].numpy(), label=f'df={df}')
     
     plt.xlabel('x')
     plt.ylabel('PDF')
@@ -176,35 +192,40 @@ def example_visualization():
 
 
 def example_optimization():
-    """Use CDF in an optimization problem."""
-    print("=" * 60)
-    print("Example 7: Optimization with CDF")
-    print("=" * 60)
-    
-    # Goal: Find the value of x where CDF = 0.95 for df=5
-    # (This is essentially finding the 95th percentile)
-    
-    df = torch.tensor(5.0)
-    dist = StudentT(df=df)
-    
-    # Initial guess
-    x = torch.tensor(1.0, requires_grad=True)
-    target_cdf = 0.95
-    
-    # Optimize using gradient descent
-    optimizer = torch.optim.Adam([x], lr=0.1)
-    
-    for i in range(100):
-        optimizer.zero_grad()
-        cdf_val = dist.cdf(x)
-        loss = (cdf_val - target_cdf) ** 2
-        loss.backward()
-        optimizer.step()
-        
-        if i % 20 == 0:
-            print(f"Iteration {i}: x={x.item():.6f}, CDF={cdf_val.item():.6f}, loss={loss.item():.8f}")
-    
-    print(f"\nFinal result: x={x.item():.6f} gives CDF={dist.cdf(x).item():.6f}")
+    """Use the CDF and PDF to solve for quantiles with Newton's method."""
+    print("=" * 60)
+    print("Example 7: Solving for Quantiles with Newton's Method")
+    print("=" * 60)
+    
+    # Goal: Find the values of x where CDF = 0.90, 0.95 and 0.99 for df=5
+    # (the 90th, 95th and 99th percentiles), all in one batch
+    
+    dist = StudentT(df=torch.tensor(5.0, dtype=torch.float64))
+    targets = torch.tensor([0.90, 0.95, 0.99], dtype=torch.float64)
+    
+    # Initial guess from the normal approximation: x0 = Φ⁻¹(target)
+    x = math.sqrt(2) * torch.erfinv(2 * targets - 1)
+    
+    # The CDF is monotone with derivative equal to the PDF, so Newton's
+    # method x <- x - (CDF(x) - target) / PDF(x) converges quadratically,
+    # even in the tails where the normal approximation is furthest off.
+    # Taking the derivative from log_prob in closed form means x never
+    # needs requires_grad, and no backward pass runs through the
+    # continued fraction inside the CDF.
+    with torch.inference_mode():
+        for i in range(10):
+            f = dist.cdf(x) - targets
+            step = f / torch.exp(dist.log_prob(x))
+            x = x - step
+            
+            print(f"Iteration {i}: max CDF error={f.abs().max().item():.2e}")
+            if step.abs().max() < 1e-10:
+                break
+        cdf_values = dist.cdf(x)
+    
+    print("\nQuantiles of t(df=5):")
+    for p, q, c in zip(targets.tolist(), x.tolist(), cdf_values.tolist()):
+        print(f"  p={p:.2f}: x={q:.6f} (CDF={c:.6f})")
     print(f"(The 95th percentile for t(df=5) is approximately 2.015)")
     print()
 